@@ -0,0 +1,130 @@
+# console_io.py
+"""
+Console input and output shared by main.py, staff_menu.py and student_menu.py.
+
+read_choice(prompt) behaves exactly like input(prompt). Scripted runs and
+test harnesses can opt in to batch input by setting CAMPUS_BATCH_INPUT=1:
+then the whole of stdin is read once and the lines are handed out from a
+queue, so each prompt costs no extra read syscall and no forced flush of
+stdout. It is never switched on automatically, since an interactive console
+may also hand the program a pipe instead of a terminal.
+
+format_table / stream_table lay out rows of tuples as plain text tables.
+tabulate is optional: it is only used after set_fancy_tables(True)
+(main.py --fancy), for box-drawn tables.
+"""
+
+import os
+import sys
+from collections import deque
+from itertools import chain, islice
+from typing import Deque, Iterable, Optional, Sequence, TextIO
+
+try:
+    from tabulate import tabulate as _tabulate
+except ImportError:  # optional, only needed for --fancy
+    _tabulate = None
+
+# Batch input is opt-in (see the module docstring)
+BATCH_INPUT = os.environ.get("CAMPUS_BATCH_INPUT") == "1"
+
+# Stream that was read in one go in batch mode, and its lines not yet handed out
+_source: Optional[TextIO] = None
+_pending: Deque[str] = deque()
+
+# stream_table sizes columns from the headers and this many leading rows
+PREVIEW_ROWS = 50
+
+# True when tables should be drawn by tabulate (see set_fancy_tables)
+_fancy = False
+
+
+def read_choice(prompt: str = "") -> str:
+    """Drop-in replacement for input(): raises EOFError when input runs out."""
+    global _source, _pending
+
+    if not BATCH_INPUT:
+        return input(prompt)
+
+    stdin = sys.stdin
+    if stdin is not _source:
+        _source = stdin
+        _pending = deque(stdin.read().splitlines())
+
+    sys.stdout.write(prompt)  # no flush: piped output is block-buffered anyway
+    if not _pending:
+        raise EOFError
+    return _pending.popleft()
+
+
+def set_fancy_tables(enabled: bool) -> bool:
+    """
+    Switch box-drawn (tabulate "fancy_grid") tables on or off.
+    Returns whether fancy tables are now in use (False if tabulate is missing).
+    """
+    global _fancy
+    _fancy = bool(enabled) and _tabulate is not None
+    return _fancy
+
+
+def _row_format(widths: Sequence[int]) -> str:
+    # Last column is not padded, so lines carry no trailing spaces
+    return " | ".join([f"%-{w}s" for w in widths[:-1]] + ["%s"])
+
+
+def format_table(rows: Iterable[tuple], headers: tuple) -> str:
+    """
+    Return rows as table text: header, rule, then one line per row.
+    headers and rows must be tuples (namedtuples are fine); rows may be a
+    generator. Column widths are found in a single pass over the rows.
+    """
+    if not isinstance(rows, (list, tuple)):
+        rows = list(rows)  # widths need every row; a list is used as-is
+    if _fancy:
+        return _tabulate(rows, headers=headers, tablefmt="fancy_grid")
+
+    widths = [len(h) for h in headers]
+    for row in rows:
+        widths = [max(w, len(str(c))) for w, c in zip(widths, row)]
+
+    line = _row_format(widths).__mod__  # the format string is bound once for every row
+    lines = [line(headers), "-+-".join("-" * w for w in widths)]
+    lines.extend(map(line, rows))
+    return "\n".join(lines)
+
+
+def stream_table(rows: Iterable[tuple], headers: tuple) -> int:
+    """
+    Print rows as a table without collecting them all first.
+    Only the first PREVIEW_ROWS rows are held to size the columns; the rest
+    are written as they arrive (a later, wider value just widens its line).
+    headers and rows must be tuples, as for format_table.
+    Returns the number of rows printed (0 prints nothing).
+    """
+    write = sys.stdout.write
+
+    if _fancy:  # tabulate needs every row up front
+        if not isinstance(rows, (list, tuple)):
+            rows = list(rows)
+        if rows:
+            write("\n" + format_table(rows, headers) + "\n")
+        return len(rows)
+
+    rows = iter(rows)
+    preview = list(islice(rows, PREVIEW_ROWS))
+    if not preview:
+        return 0
+
+    widths = [len(h) for h in headers]
+    for row in preview:
+        widths = [max(w, len(str(c))) for w, c in zip(widths, row)]
+
+    fmt = _row_format(widths) + "\n"
+    write("\n" + fmt % headers + "-+-".join("-" * w for w in widths) + "\n")
+
+    line = fmt.__mod__  # the format string is bound once for every row
+    count = 0
+    for row in chain(preview, rows):
+        write(line(row))
+        count += 1
+    return count
@@ -16,11 +16,71 @@ This file is designed to match SystemManager's expectations:
   save_students(list[dict]) -> None
   save_resources(list[dict]) -> None
   save_transactions(list[dict]) -> None
+  save_batch(students=..., resources=..., transactions=...) -> None
+  append_student(dict) -> None
+  append_resource(dict) -> None
+  append_transaction(dict) -> None
+  compact_all() -> None
+
+New records can also be appended to a JSON Lines journal next to their
+file (e.g. transactions.json.log) instead of rewriting the whole file;
+loads merge in every journaled record whose id is not in the file yet,
+and any full save folds the journal back.
 """
 
+import errno
+import functools
+import hashlib
 import json  # handles data format
+import mmap
 import os    # handles files on disk
-from typing import Any, Dict, List, Optional
+import re
+from typing import Any, Dict, List, Optional, Tuple
+
+# orjson is an optional, much faster C parser/serializer.
+# If it is not installed we fall back to the standard json module.
+try:
+    import orjson
+except ImportError:
+    orjson = None  # type: ignore
+
+# ijson is an optional streaming parser used for very large files.
+try:
+    import ijson
+except ImportError:
+    ijson = None  # type: ignore
+
+# Files from this size up to DIRECT_READ_THRESHOLD are parsed straight from an
+# mmap of the file (orjson only), avoiding the copy into a bytes object.
+MMAP_READ_THRESHOLD = 64 << 10  # 64 KB
+
+# Files larger than this are read with O_DIRECT (bypassing the page cache).
+DIRECT_READ_THRESHOLD = 1 << 20  # 1 MB
+
+# Files larger than this are parsed record by record with ijson (if installed).
+STREAM_PARSE_THRESHOLD = 4 << 20  # 4 MB
+
+# Once an append journal grows past this size it is folded into its JSON file.
+JOURNAL_COMPACT_THRESHOLD = 256 << 10  # 256 KB
+
+
+# Finds the first non-whitespace byte (used to detect "empty" mapped files)
+_NON_SPACE = re.compile(rb"\S")
+
+# Returned by _decode_mapped when the file could not be memory-mapped
+_NOT_MAPPED = object()
+
+# Stands for a file that is empty or contains only whitespace
+_EMPTY_FILE = object()
+
+
+def _copy_records(data: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+    """
+    Copy of a list of records, independent of the original.
+    Records are flat (scalar values only), so copying each dict is enough
+    and much cheaper than a deepcopy.
+    """
+    return [dict(r) for r in data]
 
 
 class FileManagerError(Exception):
@@ -48,6 +108,44 @@ class FileManager:
 
         self.data_dir = data_dir
 
+        # Paths already known to exist, so loads skip the existence check.
+        self._ensured: set = set()
+
+        # Parsed file contents keyed by path: (mtime_ns, size, journal_size, data).
+        # A file is only parsed again when os.stat shows it has changed.
+        # The journal size (or -1 if there is none) is part of the key.
+        # The cached lists are private: never handed out or taken from a caller.
+        self._cache: Dict[str, Tuple[int, int, int, List[Dict[str, Any]]]] = {}
+
+        # BLAKE2b digest of the bytes last written to each path, with the
+        # file's mtime_ns and size right after that write.
+        self._last_hash: Dict[str, Tuple[bytes, int, int]] = {}
+
+        # One encoder/decoder for the lifetime of this FileManager instead of
+        # setting one up on every save. check_circular is off because the data
+        # is always plain nested dicts/lists of scalars.
+        if orjson:
+            self._decode = orjson.loads
+            self._encode = functools.partial(
+                orjson.dumps, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS
+            )
+            self._encode_line = functools.partial(orjson.dumps, option=orjson.OPT_NON_STR_KEYS)
+        else:
+            encoder = json.JSONEncoder(
+                indent=2,
+                ensure_ascii=False,  # allows non-English characters
+                check_circular=False,
+                separators=(",", ": "),
+            )
+            line_encoder = json.JSONEncoder(
+                ensure_ascii=False,
+                check_circular=False,
+                separators=(",", ":"),
+            )
+            self._decode = json.loads
+            self._encode = lambda data: encoder.encode(data).encode("utf-8")
+            self._encode_line = lambda data: line_encoder.encode(data).encode("utf-8")
+
         # Store file names (same directory or inside data_dir).
         self.students_file = self._resolve_path(str(students_file).strip())
         self.resources_file = self._resolve_path(str(resources_file).strip())
@@ -56,6 +154,13 @@ class FileManager:
         if not self.students_file or not self.resources_file or not self.transactions_file:
             raise ValueError("File names cannot be empty.")
 
+        # Field that identifies a record in each file (used to merge journals)
+        self._id_fields = {
+            self.students_file: "student_id",
+            self.resources_file: "resource_id",
+            self.transactions_file: "transaction_id",
+        }
+
         # Ensure directory exists (if using data_dir)
         if self.data_dir:
             os.makedirs(self.data_dir, exist_ok=True)
@@ -68,14 +173,15 @@ class FileManager:
     # ----------------------------
     # Public load methods
     # ----------------------------
+    # Each call returns a fresh list of fresh dicts; the caller may change them
     def load_students(self) -> List[Dict[str, Any]]:
-        return self._load_list(self.students_file)
+        return _copy_records(self._load_list(self.students_file))
 
     def load_resources(self) -> List[Dict[str, Any]]:
-        return self._load_list(self.resources_file)
+        return _copy_records(self._load_list(self.resources_file))
 
     def load_transactions(self) -> List[Dict[str, Any]]:
-        return self._load_list(self.transactions_file)
+        return _copy_records(self._load_list(self.transactions_file))
 
     # ----------------------------
     # Public save methods
@@ -89,6 +195,52 @@ class FileManager:
     def save_transactions(self, transactions: List[Dict[str, Any]]) -> None:
         self._save_list(self.transactions_file, transactions)
 
+    def append_student(self, student: Dict[str, Any]) -> None:
+        """Records one new student by appending a line to the journal."""
+        self._append_record(self.students_file, student)
+
+    def append_resource(self, resource: Dict[str, Any]) -> None:
+        """Records one new resource by appending a line to the journal."""
+        self._append_record(self.resources_file, resource)
+
+    def append_transaction(self, transaction: Dict[str, Any]) -> None:
+        """
+        Records one new transaction by appending a line to the journal,
+        instead of rewriting all of transactions.json.
+        """
+        self._append_record(self.transactions_file, transaction)
+
+    def compact_transactions(self) -> None:
+        """Folds the transactions journal back into transactions.json."""
+        self._compact(self.transactions_file)
+
+    def compact_all(self) -> None:
+        """Folds every existing journal back into its JSON file."""
+        for path in (self.students_file, self.resources_file, self.transactions_file):
+            if self._journal_size(path) >= 0:
+                self._compact(path)
+
+    def save_batch(
+        self,
+        students: Optional[List[Dict[str, Any]]] = None,
+        resources: Optional[List[Dict[str, Any]]] = None,
+        transactions: Optional[List[Dict[str, Any]]] = None,
+    ) -> None:
+        """
+        Saves any of the three lists in one batch.
+        Lists left as None are not written. All temp files are written
+        before any original file is replaced.
+        """
+        items = []
+        if students is not None:
+            items.append((self.students_file, students))
+        if resources is not None:
+            items.append((self.resources_file, resources))
+        if transactions is not None:
+            items.append((self.transactions_file, transactions))
+        if items:
+            self._save_many(items)
+
     # ----------------------------
     # Internal helpers
     # ----------------------------
@@ -109,11 +261,149 @@ class FileManager:
         open(path, "w") creates the file and writes an empty JSON list into it so the system can safely load data later.
         "encoding='utf-8' tells Python how to convert raw bytes from the file into readable
         text (and back to bytes when saving), ensuring all characters are handled correctly."
+        Paths checked once are remembered in self._ensured, so repeat calls cost nothing.
         """
+        if path in self._ensured:
+            return
+
         if not os.path.exists(path):
             with open(path, "w", encoding="utf-8") as f:
                 f.write("[]")
 
+        self._ensured.add(path)
+
+    def _stat_data_file(self, path: str) -> os.stat_result:
+        """
+        os.stat of a data file, creating it first if needed. A file that was
+        deleted after it was ensured is recreated as an empty list.
+        """
+        self._ensure_file(path)
+        try:
+            return os.stat(path)
+        except FileNotFoundError:
+            self._ensured.discard(path)
+            self._ensure_file(path)
+            return os.stat(path)
+
+    def _read_bytes(self, path: str) -> bytes:
+        """
+        Reads the whole file as raw bytes.
+        The file size is taken from os.fstat so the content is normally read
+        with a single os.read call (no text decoding, no extra copies).
+        Files above DIRECT_READ_THRESHOLD are read with O_DIRECT when possible.
+        """
+        fd = os.open(path, os.O_RDONLY)
+        try:
+            size = os.fstat(fd).st_size
+
+            if size > DIRECT_READ_THRESHOLD:
+                raw = self._read_direct(path, size)
+                if raw is not None:
+                    return raw
+
+            raw = os.read(fd, size)
+            if len(raw) < size:
+                # Short read (very large file or file changed while reading)
+                chunks = [raw]
+                while True:
+                    chunk = os.read(fd, 65536)
+                    if not chunk:
+                        break
+                    chunks.append(chunk)
+                raw = b"".join(chunks)
+            return raw
+        finally:
+            os.close(fd)
+
+    def _decode_mapped(self, path: str) -> Any:
+        """
+        Parses a file directly from a read-only memory map with orjson, so the
+        kernel's page cache pages are used without copying them into a bytes
+        object. Returns _EMPTY_FILE for a whitespace-only file, or _NOT_MAPPED
+        if the file cannot be mapped (the caller then uses a normal read).
+        """
+        fd = os.open(path, os.O_RDONLY)
+        try:
+            try:
+                mm = mmap.mmap(fd, 0, access=mmap.ACCESS_READ)
+            except (OSError, ValueError):
+                return _NOT_MAPPED
+
+            try:
+                if _NON_SPACE.search(mm) is None:
+                    return _EMPTY_FILE
+                view = memoryview(mm)
+                try:
+                    return orjson.loads(view)
+                finally:
+                    view.release()
+            finally:
+                mm.close()
+        finally:
+            os.close(fd)
+
+    def _write_bytes(self, path: str, buf: bytes) -> None:
+        """
+        Writes already-serialized bytes to path (created or truncated).
+        Normally this is one os.write call; the loop only continues after a
+        partial write, using a memoryview so nothing is copied.
+        The data is flushed to disk (fsync) before returning.
+        """
+        fd = os.open(path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o644)
+        try:
+            view = memoryview(buf)
+            written = 0
+            while written < len(view):
+                written += os.write(fd, view[written:])
+            os.fsync(fd)
+        finally:
+            os.close(fd)
+
+    def _read_direct(self, path: str, size: int) -> Optional[bytes]:
+        """
+        Reads a large file with O_DIRECT into a page-aligned buffer.
+        Chunk size grows with the file (64 KB up to 16 MB).
+        Returns None when O_DIRECT is not supported here (e.g. tmpfs, NFS,
+        or a platform without O_DIRECT) so the caller can use a normal read.
+        """
+        if not hasattr(os, "O_DIRECT") or not hasattr(os, "preadv"):
+            return None
+
+        try:
+            fd = os.open(path, os.O_RDONLY | os.O_DIRECT)
+        except OSError as e:
+            if e.errno == errno.EINVAL:
+                return None
+            raise
+
+        try:
+            page = mmap.PAGESIZE
+            aligned_size = (size + page - 1) // page * page
+            chunk = min(16 << 20, max(64 << 10, aligned_size // 16))
+            chunk = (chunk + page - 1) // page * page
+
+            buf = mmap.mmap(-1, aligned_size)  # anonymous mmap is page-aligned
+            view = memoryview(buf)
+            try:
+                offset = 0
+                while offset < aligned_size:
+                    part = view[offset:offset + chunk]
+                    n = os.preadv(fd, [part], offset)
+                    part.release()
+                    offset += n
+                    if n < chunk:
+                        break  # reached end of file
+                return bytes(view[:min(offset, size)])
+            except OSError as e:
+                if e.errno == errno.EINVAL:
+                    return None
+                raise
+            finally:
+                view.release()
+                buf.close()
+        finally:
+            os.close(fd)
+
     def _load_list(self, path: str) -> List[Dict[str, Any]]:
         """
         Loads a JSON file expected to contain a list of dicts.
@@ -121,22 +411,48 @@ class FileManager:
         - Empty file: returns [] (and repairs it to [])
         - Invalid JSON: raises FileCorruptionError
         - Wrong root type (not list): raises FileCorruptionError
-        """
-        self._ensure_file(path)  # Ensures file exists and contains at least []
 
+        Unchanged files are served from the cache, so the returned list is
+        the cached one: callers must not change it (load_* hand out copies).
+        """
         try:
-            with open(path, "r", encoding="utf-8") as f:
-                raw = f.read().strip()
-
-                if raw == "":
-                    # Empty file treated as empty list (then repaired)
-                    self._save_list(path, [])
-                    return []
-
-                data = json.loads(raw)  # Converts JSON text → Python objects
+            # Stat BEFORE reading: if the file changes while we read it,
+            # the stored key is already stale and the next load re-reads it.
+            st = self._stat_data_file(path)
+
+            journal_size = self._journal_size(path)
+
+            cached = self._cache.get(path)
+            if cached is not None and cached[:3] == (st.st_mtime_ns, st.st_size, journal_size):
+                return cached[3]
+
+            if ijson is not None and st.st_size > STREAM_PARSE_THRESHOLD:
+                cleaned = self._stream_list(path)
+                self._merge_journal(path, cleaned)
+                self._cache[path] = (st.st_mtime_ns, st.st_size, journal_size, cleaned)
+                return cleaned
+
+            data = _NOT_MAPPED
+            if orjson and MMAP_READ_THRESHOLD <= st.st_size <= DIRECT_READ_THRESHOLD:
+                data = self._decode_mapped(path)
+
+            if data is _NOT_MAPPED:
+                raw = self._read_bytes(path)
+                # Converts JSON bytes → Python objects (both parsers accept UTF-8 bytes)
+                data = self._decode(raw) if raw.strip() else _EMPTY_FILE
+
+            if data is _EMPTY_FILE:
+                # Empty file treated as empty list, then repaired. The repair
+                # is a full save (which removes the journal), so the journal
+                # is merged in first.
+                data = []
+                self._merge_journal(path, data)
+                self._save_list(path, data)
+                return data
 
         except json.JSONDecodeError as e:
             # Raised when JSON text is malformed or invalid
+            # (orjson.JSONDecodeError is a subclass of json.JSONDecodeError)
             raise FileCorruptionError(
                 f"File '{path}' contains invalid JSON. Please fix or delete the file."
             ) from e
@@ -144,32 +460,207 @@ class FileManager:
             raise FileManagerError(f"Could not read file '{path}'.") from e
 
         if data is None:
-            return []
+            data = []
 
         if not isinstance(data, list):
             raise FileCorruptionError(
                 f"File '{path}' must contain a JSON list (e.g., [])."
             )
 
-        # Ensure each entry is a dict
-        cleaned: List[Dict[str, Any]] = []
-        for i, item in enumerate(data):
-            if isinstance(item, dict):
-                cleaned.append(item)
-            else:
+        # Ensure each entry is a dict. The parser only ever produces plain dicts,
+        # so an exact type check is enough, and the parsed list is used as-is.
+        bad = next((i for i, item in enumerate(data) if type(item) is not dict), -1)
+        if bad >= 0:
+            raise FileCorruptionError(
+                f"File '{path}' contains a non-object entry at index {bad}. "
+                "Expected each list item to be a JSON dictionary."
+            )
+
+        self._merge_journal(path, data)
+
+        self._cache[path] = (st.st_mtime_ns, st.st_size, journal_size, data)
+        return data
+
+    # ----------------------------
+    # Append journal (JSON Lines)
+    # ----------------------------
+    def _journal_path(self, path: str) -> str:
+        return f"{path}.log"
+
+    def _journal_size(self, path: str) -> int:
+        """Size of the journal for path, or -1 if it does not exist."""
+        try:
+            return os.stat(self._journal_path(path)).st_size
+        except FileNotFoundError:
+            return -1
+
+    def _read_journal(self, path: str) -> List[Dict[str, Any]]:
+        """
+        Returns every record in path's journal, in the order appended.
+        A torn last line (no trailing newline, e.g. after a crash) is ignored.
+        """
+        jpath = self._journal_path(path)
+        try:
+            raw = self._read_bytes(jpath)
+        except FileNotFoundError:
+            return []
+        except OSError as e:
+            raise FileManagerError(f"Could not read file '{jpath}'.") from e
+
+        lines = raw.split(b"\n")
+        lines.pop()  # text after the last newline is empty or an unfinished append
+
+        records: List[Dict[str, Any]] = []
+        for n, line in enumerate(lines, start=1):
+            try:
+                record = self._decode(line)
+            except json.JSONDecodeError as e:
                 raise FileCorruptionError(
-                    f"File '{path}' contains a non-object entry at index {i}. "
-                    "Expected each list item to be a JSON dictionary."
+                    f"File '{jpath}' contains invalid JSON on line {n}. Please fix or delete the file."
+                ) from e
+            if type(record) is not dict:
+                raise FileCorruptionError(
+                    f"File '{jpath}' contains a non-object entry on line {n}."
                 )
+            records.append(record)
+        return records
+
+    def _merge_journal(self, path: str, data: List[Dict[str, Any]]) -> None:
+        """
+        Adds the journaled records of path to data, skipping any whose id is
+        already in data. A journal left behind by an interrupted full save
+        therefore adds nothing twice, and a journal never depends on the
+        JSON file's inode or mtime (so copying or touching the files is safe).
+        """
+        records = self._read_journal(path)
+        if not records:
+            return
+
+        key = self._id_fields[path]
+        seen = {r.get(key) for r in data}
+        for record in records:
+            rid = record.get(key)
+            if rid is None or rid in seen:
+                continue  # already saved (or not a record, e.g. an old header line)
+            seen.add(rid)
+            data.append(record)
+
+    def _append_record(self, path: str, record: Dict[str, Any]) -> None:
+        """
+        Appends one record to path's journal with a single os.write (O_APPEND).
+        The journal is never truncated while it may hold records: only an
+        unfinished last line (a torn append) is cut off before writing.
+        The journal is fsynced before returning.
+        """
+        if not isinstance(record, dict):
+            raise FileManagerError("Record to append must be a dictionary.")
+
+        jpath = self._journal_path(path)
+        line = self._encode_line(record) + b"\n"
+
+        try:
+            self._stat_data_file(path)  # recreated if it was deleted meanwhile
+            fd = os.open(jpath, os.O_RDWR | os.O_CREAT | os.O_APPEND, 0o644)
+            try:
+                size = os.fstat(fd).st_size
+                if size and os.pread(fd, 1, size - 1) != b"\n":
+                    # Journals stay small (see JOURNAL_COMPACT_THRESHOLD)
+                    os.ftruncate(fd, os.pread(fd, size, 0).rfind(b"\n") + 1)
+
+                view = memoryview(line)
+                written = 0
+                while written < len(view):
+                    written += os.write(fd, view[written:])
+                os.fsync(fd)
+                journal_size = os.fstat(fd).st_size
+            finally:
+                os.close(fd)
+
+        except OSError as e:
+            raise FileManagerError(f"Could not append to file '{jpath}'.") from e
+        finally:
+            # The JSON file on its own no longer holds everything
+            self._cache.pop(path, None)
+            self._last_hash.pop(path, None)
+
+        if journal_size > JOURNAL_COMPACT_THRESHOLD:
+            self._compact(path)
+
+    def _compact(self, path: str) -> None:
+        """Rewrites path with its journal merged in (the save removes the journal)."""
+        self._save_list(path, self._load_list(path))
+
+    def _remove_journal(self, path: str) -> None:
+        try:
+            os.remove(self._journal_path(path))
+        except FileNotFoundError:
+            pass
+
+    def _stream_list(self, path: str) -> List[Dict[str, Any]]:
+        """
+        Parses a large JSON list one record at a time with ijson.
+        Validation and list building happen in the same pass, so the whole
+        document is never held in memory next to the parsed list.
+        """
+        cleaned: List[Dict[str, Any]] = []
+        try:
+            with open(path, "rb") as f:
+                # ijson only yields items of a top-level array, so check the root first
+                first = f.read(1)
+                while first and first.isspace():
+                    first = f.read(1)
+                if first != b"[":
+                    raise FileCorruptionError(
+                        f"File '{path}' must contain a JSON list (e.g., [])."
+                    )
+                f.seek(0)
+
+                for i, item in enumerate(ijson.items(f, "item", use_float=True)):
+                    if type(item) is not dict:
+                        raise FileCorruptionError(
+                            f"File '{path}' contains a non-object entry at index {i}. "
+                            "Expected each list item to be a JSON dictionary."
+                        )
+                    cleaned.append(item)
+
+        except ijson.JSONError as e:
+            raise FileCorruptionError(
+                f"File '{path}' contains invalid JSON. Please fix or delete the file."
+            ) from e
+        except OSError as e:
+            raise FileManagerError(f"Could not read file '{path}'.") from e
 
         return cleaned
 
     def _save_list(self, path: str, data: List[Dict[str, Any]]) -> None:
         """
         Saves a list of dicts to JSON with safe writing:
-        - Writes to a temp file first
+        - Writes to a temp file first (flushed to disk)
         - Then replaces the original file
         """
+        self._save_many([(path, data)])
+
+    def _unchanged_since_last_save(self, path: str, digest: bytes) -> Optional[os.stat_result]:
+        """
+        Returns the file's stat if its last save had the same content hash and
+        the file has not been modified since (same mtime and size), else None.
+        """
+        last = self._last_hash.get(path)
+        if last is None or last[0] != digest:
+            return None
+        try:
+            st = os.stat(path)
+        except OSError:
+            return None
+        if (st.st_mtime_ns, st.st_size) != (last[1], last[2]):
+            return None
+        return st
+
+    def _serialize(self, data: Optional[List[Dict[str, Any]]]) -> Tuple[List[Dict[str, Any]], bytes]:
+        """
+        Validates a list of dicts and converts it to UTF-8 JSON bytes.
+        Returns the (possibly defaulted) list together with its bytes.
+        """
         if data is None:
             data = []
 
@@ -182,31 +673,67 @@ class FileManager:
                     f"Data to save must be a list of dictionaries. Bad entry at index {i}."
                 )
 
-        tmp_path = f"{path}.tmp"
+        return data, self._encode(data)
+
+    def _save_many(self, items: List[Tuple[str, Optional[List[Dict[str, Any]]]]]) -> None:
+        """
+        Saves one or more (path, list) pairs as a single batch:
+        - Validates and serializes everything first (nothing touches disk on bad data)
+        - Writes and fsyncs every temp file
+        - Only then replaces the original files, one after another
+        Files whose serialized content matches what we last wrote (and that
+        were not touched since) are skipped entirely.
+        """
+        prepared = []
+        for path, data in items:
+            data, buf = self._serialize(data)
+            digest = hashlib.blake2b(buf, digest_size=16).digest()
+
+            st = self._unchanged_since_last_save(path, digest)
+            if st is not None:
+                self._cache[path] = (st.st_mtime_ns, st.st_size, self._journal_size(path), _copy_records(data))
+                continue
+
+            prepared.append((path, data, buf, digest))
+
+        written: List[str] = []
+        path = ""
 
         try:
-            with open(tmp_path, "w", encoding="utf-8") as f:
-                json.dump(
-                    data,
-                    f,
-                    indent=2,
-                    ensure_ascii=False  # allows non-English characters
-                )
+            for path, data, buf, digest in prepared:
+                tmp_path = f"{path}.tmp"
+                written.append(tmp_path)
+                self._write_bytes(tmp_path, buf)
 
-            # Replace original file with temp file
-            os.replace(tmp_path, path)
+            for path, data, buf, digest in prepared:
+                # Replace original file with temp file
+                os.replace(f"{path}.tmp", path)
+                written.remove(f"{path}.tmp")
+
+                # The saved list already contains everything from the journal
+                self._remove_journal(path)
+
+                # Next load of this file is a cache hit. The cache keeps its
+                # own copy: the caller goes on changing the list it saved.
+                st = os.stat(path)
+                self._cache[path] = (st.st_mtime_ns, st.st_size, -1, _copy_records(data))
+                self._last_hash[path] = (digest, st.st_mtime_ns, st.st_size)
 
         except OSError as e:
-            # Attempt cleanup
-            try:
-                if os.path.exists(tmp_path):
-                    os.remove(tmp_path)
-            except OSError:
-                pass
+            # Attempt cleanup of temp files that were not moved into place
+            for tmp_path in written:
+                try:
+                    if os.path.exists(tmp_path):
+                        os.remove(tmp_path)
+                except OSError:
+                    pass
+            for p, _, _, _ in prepared:
+                self._cache.pop(p, None)
+                self._last_hash.pop(p, None)
             raise FileManagerError(f"Could not write file '{path}'.") from e
 
         '''
-        _save_list safely writes a list of dictionaries to a JSON file by validating data,
-        writing to a temporary file first, and atomically replacing the original file
+        _save_many safely writes lists of dictionaries to JSON files by validating data,
+        writing to temporary files first, and atomically replacing the original files
         to prevent corruption.
         '''
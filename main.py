@@ -16,6 +16,11 @@ Note:
 
 from __future__ import annotations
 
+import atexit
+import sys
+from functools import lru_cache
+
+from console_io import read_choice, set_fancy_tables
 from file_manager import FileManager, FileManagerError, FileCorruptionError
 from system_manager import SystemManager, SystemManagerError, ValidationError, RoleConfig
 
@@ -39,16 +44,19 @@ def _print_header() -> None:
 
 
 def _prompt_email() -> str:
-    return input("\nEnter your campus email (or 0 to exit): ").strip()
+    return read_choice("\nEnter your campus email (or 0 to exit): ").strip()
 
 
 def _prompt_continue() -> None:
-    input("\nPress Enter to continue...")
+    read_choice("\nPress Enter to continue...")
 
 
 def main() -> None:
     _print_header()
 
+    # "python main.py --fancy" draws box tables with tabulate (if installed)
+    if "--fancy" in sys.argv[1:] and not set_fancy_tables(True):
+        print("\n--fancy needs the tabulate package; using plain tables.")
 
     try:
         fm = FileManager(
@@ -64,8 +72,8 @@ def main() -> None:
     # Configuring your campus domains:
 
     role_config = RoleConfig(                        #This creates a RoleConfig object with custom values.
-        student_domains=("alustudent.com",),
-        staff_domains=("alueducation.com",),
+        student_domains=frozenset({"alustudent.com"}),
+        staff_domains=frozenset({"alueducation.com"}),
     )
 
     sm = SystemManager(file_manager=fm, due_days=3, role_config=role_config) #This line is creating a SystemManager object and passing three arguments into its constructor (__init__).
@@ -81,16 +89,27 @@ def main() -> None:
         print(f"\nCould not load data: {e}")
         return
 
+    # On exit: save changes still held in memory (normally the menus flush
+    # them when the user logs out), then fold the append journals back into
+    # the JSON files so those are complete on their own
+    atexit.register(sm.close)
+
+    # Repeat logins with the same email skip role detection entirely.
+    # (Invalid emails raise, and exceptions are never cached.)
+    @lru_cache(maxsize=128)
+    def _cached_role(email_lower: str) -> str:
+        return sm.determine_role(email_lower)
+
     # Main loop: ask for email -> route -> return here
     while True:
-        email = _prompt_email()
+        email = _prompt_email().lower()  # normalized once for the whole loop iteration
 
         if email == "0":
             print("\nGoodbye.")
             break
 
         try:
-            role = sm.determine_role(email)
+            role = _cached_role(email)
         except ValidationError as e:
             print(f"\nInvalid email: {e}")
             _prompt_continue()
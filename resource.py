@@ -1,4 +1,6 @@
 class Resource:
+    __slots__ = ("resource_id", "name", "rtype", "quantity")
+
     def __init__(self, resource_id: str, name: str, rtype: str, quantity: int):
         if not resource_id.strip():
             raise ValueError("resource_id cannot be empty")
@@ -1,69 +1,52 @@
 # staff_menu.py
 
 from datetime import date
-from tabulate import tabulate
 
+from console_io import read_choice, stream_table
 from system_manager import SystemManagerError, ValidationError, NotFoundError, ConflictError
 
+__all__ = ["staff_menu"]
+
+
+# Table headers, built once at import
+TRANSACTION_HEADERS = (
+    "Transaction ID",
+    "Student ID",
+    "Resource ID",
+    "Borrow Date",
+    "Due Date",
+    "Return Date",
+    "Status",
+)
+RESOURCE_HEADERS = ("Resource ID", "Name", "Category", "Quantity")
+
 
 # -------------------------------------------------
-# Helper function: print transactions in table form (TABULATE)
+# Helper function: print transactions in table form
 # -------------------------------------------------
 def print_transactions_table(transactions):
     """
-    Display transactions in a clean table using tabulate.
+    Display transactions (any iterable of TransactionRecord) as a table.
     """
-    if not transactions:
+    rows = (
+        t if t.return_date else t._replace(return_date="-")
+        for t in transactions
+    )
+
+    if not stream_table(rows, TRANSACTION_HEADERS):
         print("\nNo transactions found.")
-        return
-
-    table_data = []
-    for t in transactions:
-        table_data.append([
-            t.get("transaction_id", "N/A"),
-            t.get("student_id", "N/A"),
-            t.get("resource_id", "N/A"),
-            t.get("borrow_date", "N/A"),
-            t.get("due_date", "N/A"),
-            t.get("return_date") if t.get("return_date") else "-",
-            t.get("status", "N/A"),
-        ])
-
-    headers = [
-        "Transaction ID",
-        "Student ID",
-        "Resource ID",
-        "Borrow Date",
-        "Due Date",
-        "Return Date",
-        "Status"
-    ]
-
-    print("\n" + tabulate(table_data, headers=headers, tablefmt="fancy_grid"))
 
 
 # -------------------------------------------------
-# Helper function: print resources in table form (TABULATE)
+# Helper function: print resources in table form
 # -------------------------------------------------
 def print_resources_table(resources):
     """
-    Display resources in a clean table using tabulate.
+    Display resources (any iterable of ResourceRecord) as a table.
+    The records are already tuples in column order, so they are the rows.
     """
-    if not resources:
+    if not stream_table(resources, RESOURCE_HEADERS):
         print("\nNo resources found.")
-        return
-
-    table_data = []
-    for r in resources:
-        table_data.append([
-            r.get("resource_id", "N/A"),
-            r.get("name", "N/A"),
-            r.get("type", "N/A"),
-            r.get("quantity", 0),
-        ])
-
-    headers = ["Resource ID", "Name", "Category", "Quantity"]
-    print("\n" + tabulate(table_data, headers=headers, tablefmt="fancy_grid"))
 
 
 # -------------------------------------------------
@@ -84,7 +67,7 @@ def back_to_menu_or_exit():
         print("1) Go back to Staff Menu")
         print("0) Exit to Main Menu")
 
-        choice = input("Choose option: ").strip()
+        choice = read_choice("Choose option: ").strip()
 
         if choice == "1":
             return True
@@ -98,6 +81,13 @@ def back_to_menu_or_exit():
 # Staff Menu
 # -------------------------------------------------
 def staff_menu(system_manager):
+    # Changes made during the session are kept in memory and written to
+    # disk once, when the staff member leaves.
+    with system_manager:
+        _staff_menu_loop(system_manager)
+
+
+def _staff_menu_loop(system_manager):
     while True:
         print("\n==============================")
         print("          STAFF MENU")
@@ -110,14 +100,14 @@ def staff_menu(system_manager):
         print("6) View overdue transactions")
         print("0) Exit")
 
-        choice = input("Choose option: ").strip()
+        choice = read_choice("Choose option: ").strip()
 
         # ----------------------------
         # Add resource
         # ----------------------------
         if choice == "1":
             # Check ID first before asking for other details
-            resource_id = input("Resource ID: ").strip()
+            resource_id = read_choice("Resource ID: ").strip()
 
             # Validate immediately
             if not resource_id:
@@ -138,9 +128,9 @@ def staff_menu(system_manager):
 
             # Only ask for other details if ID is unique
             print("Resource ID is available.")
-            name = input("Name: ").strip()
-            rtype = input("Type/Category: ").strip()
-            qty_str = input("Quantity: ").strip()
+            name = read_choice("Name: ").strip()
+            rtype = read_choice("Type/Category: ").strip()
+            qty_str = read_choice("Quantity: ").strip()
 
             try:
                 quantity = int(qty_str)
@@ -166,8 +156,17 @@ def staff_menu(system_manager):
         # Update resource quantity
         # ----------------------------
         elif choice == "2":
-            resource_id = input("Resource ID: ").strip()
-            qty_str = input("New Quantity: ").strip()
+            resource_id = read_choice("Resource ID: ").strip()
+
+            # Check the ID first (cheap index lookup) before asking for the quantity
+            if not resource_id:
+                print(" Error: Resource ID cannot be empty.")
+                continue
+            if not system_manager.has_resource(resource_id):
+                print(f"\nResource not found: Resource '{resource_id}' not found.")
+                continue
+
+            qty_str = read_choice("New Quantity: ").strip()
 
             try:
                 new_quantity = int(qty_str)
@@ -193,7 +192,14 @@ def staff_menu(system_manager):
         # Remove resource
         # ----------------------------
         elif choice == "3":
-            resource_id = input("Resource ID to remove: ").strip()
+            resource_id = read_choice("Resource ID to remove: ").strip()
+
+            if not resource_id:
+                print(" Error: Resource ID cannot be empty.")
+                continue
+            if not system_manager.has_resource(resource_id):
+                print(f"\nResource not found: Resource '{resource_id}' not found.")
+                continue
 
             try:
                 system_manager.remove_resource(resource_id)
@@ -219,8 +225,7 @@ def staff_menu(system_manager):
         # ----------------------------
         elif choice == "4":
             try:
-                resources = system_manager.list_resources()
-                print_resources_table(resources)
+                print_resources_table(system_manager.iter_resources(records=True))
 
             except SystemManagerError as e:
                 print(f"\nError: {e}")
@@ -233,8 +238,7 @@ def staff_menu(system_manager):
         # ----------------------------
         elif choice == "5":
             try:
-                transactions = system_manager.list_transactions()
-                print_transactions_table(transactions)
+                print_transactions_table(system_manager.iter_transactions(records=True))
 
             except SystemManagerError as e:
                 print(f"\nError: {e}")
@@ -248,8 +252,7 @@ def staff_menu(system_manager):
         elif choice == "6":
             try:
                 today = date.today().isoformat()
-                overdue = system_manager.list_overdue(today)
-                print_transactions_table(overdue)
+                print_transactions_table(system_manager.iter_overdue(today, records=True))
 
             except SystemManagerError as e:
                 print(f"\nError: {e}")
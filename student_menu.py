@@ -6,12 +6,34 @@
 # - Return resources
 # - View their borrowing history
 
+import sys
 from datetime import date
-from tabulate import tabulate
-from system_manager import SystemManagerError, NotFoundError, ValidationError, ConflictError
+from console_io import read_choice, format_table, stream_table
+from system_manager import (
+    SystemManagerError, NotFoundError, ValidationError, ConflictError,
+    email_key, STATUS_BORROWED, COMPLETED_STATUSES,
+)
+
+
+# Separator lines around screen titles and result blocks
+_RULE = "=" * 60
+_DIVIDER = "-" * 60
+
+# Table headers, built once at import
+_AVAILABLE_HEADERS = ("Resource ID", "Name", "Category", "Quantity")
+_BORROWED_HEADERS = ("Transaction ID", "Resource ID", "Borrow Date", "Due Date")
+_ACTIVE_HEADERS = ("Transaction ID", "Resource ID", "Borrow Date", "Due Date", "Status")
+_PAST_HEADERS = ("Transaction ID", "Resource ID", "Borrow Date", "Return Date", "Status")
 
 
 def student_menu(system_manager, email_from_main: str):
+    # Changes made during the session are kept in memory and written to
+    # disk once, when the student logs out.
+    with system_manager:
+        _student_menu_loop(system_manager, email_from_main)
+
+
+def _student_menu_loop(system_manager, email_from_main: str):
     student_id = _get_or_create_student(system_manager, email_from_main)
 
     if student_id is None:
@@ -22,17 +44,17 @@ def student_menu(system_manager, email_from_main: str):
     student_name = student["name"] if student else student_id  # fallback
 
     while True:
-        print(f"\n{'=' * 60}")
+        print("\n" + _RULE)
         print(f"STUDENT MENU")
-        print(f"{'=' * 60}")
+        print(_RULE)
         print("1) View available resources")
         print("2) Borrow a resource")
         print("3) Return a resource")
         print("4) View my borrowing history")
         print("0) Logout and return to main menu")
-        print(f"{'=' * 60}")
+        print(_RULE)
 
-        choice = input("\nChoose option: ").strip()
+        choice = read_choice("\nChoose option: ").strip()
 
         if choice == "1":
             _view_available_resources(system_manager)
@@ -72,7 +94,7 @@ def _back_or_exit() -> bool:
         print("1) Go back to Student Menu")
         print("0) Exit to Main Menu")
 
-        choice = input("\nChoose option: ").strip()
+        choice = read_choice("\nChoose option: ").strip()
 
         if choice == "1":
             return True
@@ -89,18 +111,14 @@ def _get_or_create_student(system_manager, email_from_main: str):
     2) If exists -> login and return student_id
     3) If not -> register (ask name), create ID, save, then login
     """
-    print("\n" + "=" * 60)
+    print("\n" + _RULE)
     print("STUDENT LOGIN / REGISTRATION")
-    print("=" * 60)
+    print(_RULE)
 
-    email = email_from_main.strip().lower()
+    email = email_key(email_from_main)
 
-    # Check if student already exists by email
-    existing_student = None
-    for student in system_manager.students:
-        if student.get("email", "").lower() == email:
-            existing_student = student
-            break
+    # Check if student already exists by email (one index lookup)
+    existing_student = system_manager.find_student_by_email(email)
 
     if existing_student:
         print(f"\nWelcome back, {existing_student['name']}!")
@@ -108,13 +126,13 @@ def _get_or_create_student(system_manager, email_from_main: str):
 
     # Student not found -> registration starts
     print("\nFirst time login detected. Let's create your account.")
-    name = input("Enter your full name: ").strip()
+    name = read_choice("Enter your full name: ").strip()
 
     if not name:
         print("Name cannot be empty.")
         return None
 
-    student_id = _generate_student_id(system_manager)
+    student_id = system_manager.next_student_id()
 
     try:
         system_manager.add_student(student_id, name, email)
@@ -126,54 +144,35 @@ def _get_or_create_student(system_manager, email_from_main: str):
         return None
 
 
-def _generate_student_id(system_manager):
-    nums = []
-    for student in system_manager.students:
-        sid = str(student.get("student_id", ""))
-        if sid.startswith("S") and sid[1:].isdigit():
-            nums.append(int(sid[1:]))
-
-    new_num = (max(nums) + 1) if nums else 1
-    return "S" + str(new_num).zfill(3)
-
-
 def _view_available_resources(system_manager):
-    print("\n" + "=" * 60)
+    print("\n" + _RULE)
     print("AVAILABLE RESOURCES")
-    print("=" * 60)
+    print(_RULE)
 
     try:
-        available = system_manager.list_available_resources()
+        # ResourceRecord tuples are already rows; they are printed as they
+        # come and counted on the way, so no list of them is built
+        count = stream_table(system_manager.iter_available_resources(records=True), _AVAILABLE_HEADERS)
 
-        if not available:
+        if not count:
             print("\nNo resources available for borrowing at the moment.")
             print("Please check back later.")
             return
 
-        table_data = []
-        for resource in available:
-            table_data.append([
-                resource.get("resource_id", "N/A"),
-                resource.get("name", "N/A"),
-                resource.get("type", "N/A"),
-                resource.get("quantity", 0),
-            ])
-
-        headers = ["Resource ID", "Name", "Category", "Quantity"]
-        print("\n" + tabulate(table_data, headers=headers, tablefmt="fancy_grid"))
+        print(f"\nTotal available: {count}")
 
     except SystemManagerError as e:
         print(f"\nError loading resources: {e}")
 
 
 def _borrow_resource(system_manager, student_id):
-    print("\n" + "=" * 60)
+    print("\n" + _RULE)
     print("BORROW A RESOURCE")
-    print("=" * 60)
+    print(_RULE)
 
     print("\nTip: View available resources (option 1) to see what you can borrow.")
 
-    resource_id = input("\nEnter Resource ID to borrow (or 0 to cancel): ").strip()
+    resource_id = read_choice("\nEnter Resource ID to borrow (or 0 to cancel): ").strip()
 
     if resource_id == "0":
         print("Borrowing cancelled.")
@@ -183,17 +182,25 @@ def _borrow_resource(system_manager, student_id):
         print("Resource ID cannot be empty.")
         return
 
+    # A mistyped ID is the common failure, so check it with one index lookup
+    if not system_manager.has_resource(resource_id):
+        print(f"\nNot Found: Resource '{resource_id}' not found.")
+        print("Make sure you entered the correct Resource ID.")
+        return
+
     try:
         transaction = system_manager.borrow_resource(student_id, resource_id)
 
-        print("\nResource borrowed successfully!")
-        print("-" * 60)
-        print(f"Transaction ID: {transaction['transaction_id']}")
-        print(f"Resource ID:    {transaction['resource_id']}")
-        print(f"Borrow Date:    {transaction['borrow_date']}")
-        print(f"Due Date:       {transaction['due_date']}")
-        print("-" * 60)
-        print(f"Please return by {transaction['due_date']} to avoid overdue status.")
+        sys.stdout.write(
+            "\nResource borrowed successfully!\n"
+            f"{_DIVIDER}\n"
+            f"Transaction ID: {transaction['transaction_id']}\n"
+            f"Resource ID:    {transaction['resource_id']}\n"
+            f"Borrow Date:    {transaction['borrow_date']}\n"
+            f"Due Date:       {transaction['due_date']}\n"
+            f"{_DIVIDER}\n"
+            f"Please return by {transaction['due_date']} to avoid overdue status.\n"
+        )
 
     except NotFoundError as e:
         print(f"\nNot Found: {e}")
@@ -210,76 +217,66 @@ def _borrow_resource(system_manager, student_id):
 
 
 def _return_resource(system_manager, student_id):
-    print("\n" + "=" * 60)
+    print("\n" + _RULE)
     print("RETURN A RESOURCE")
-    print("=" * 60)
+    print(_RULE)
 
-    active_borrowings = []
-    for tx in system_manager.transactions:
-        if tx.get("student_id") == student_id and tx.get("status") == "borrowed":
-            active_borrowings.append(tx)
+    active_borrowings = system_manager.active_transactions_for_student(student_id)
 
     if not active_borrowings:
         print("\nYou don't have any borrowed resources to return.")
         return
 
-    table_data = []
-    for tx in active_borrowings:
-        table_data.append([
+    rows = (
+        (
             tx.get("transaction_id", "N/A"),
             tx.get("resource_id", "N/A"),
             tx.get("borrow_date", "N/A"),
             tx.get("due_date", "N/A"),
-        ])
-
-    headers = ["Transaction ID", "Resource ID", "Borrow Date", "Due Date"]
-    print("\n" + tabulate(table_data, headers=headers, tablefmt="fancy_grid"))
+        )
+        for tx in active_borrowings
+    )
+    sys.stdout.write("\n" + format_table(rows, _BORROWED_HEADERS) + "\n")
 
     print("\nHow would you like to return?")
     print("1) By Resource ID (easier)")
     print("2) By Transaction ID (more precise)")
     print("0) Cancel")
 
-    method = input("\nChoose method: ").strip()
+    method = read_choice("\nChoose method: ").strip()
 
     if method == "0":
         print("Return cancelled.")
         return
 
     elif method == "1":
-        resource_id = input("\nEnter Resource ID to return: ").strip()
+        resource_id = read_choice("\nEnter Resource ID to return: ").strip()
         if not resource_id:
             print("Resource ID cannot be empty.")
             return
+        if all(tx.get("resource_id") != resource_id for tx in active_borrowings):
+            print(f"\nError: You have no active borrowing of resource '{resource_id}'.")
+            return
 
         try:
             transaction = system_manager.return_resource_by_student_resource(student_id, resource_id)
-            print("\nResource returned successfully!")
-            print("-" * 60)
-            print(f"Transaction ID: {transaction['transaction_id']}")
-            print(f"Resource ID:    {transaction['resource_id']}")
-            print(f"Return Date:    {transaction['return_date']}")
-            print(f"Status:         {transaction['status']}")
-            print("-" * 60)
+            _print_returned(transaction)
 
         except SystemManagerError as e:
             print(f"\nError: {e}")
 
     elif method == "2":
-        transaction_id = input("\nEnter Transaction ID to return: ").strip()
+        transaction_id = read_choice("\nEnter Transaction ID to return: ").strip()
         if not transaction_id:
             print("Transaction ID cannot be empty.")
             return
+        if all(tx.get("transaction_id") != transaction_id for tx in active_borrowings):
+            print(f"\nError: '{transaction_id}' is not one of your active borrowings.")
+            return
 
         try:
             transaction = system_manager.return_resource(transaction_id)
-            print("\nResource returned successfully!")
-            print("-" * 60)
-            print(f"Transaction ID: {transaction['transaction_id']}")
-            print(f"Resource ID:    {transaction['resource_id']}")
-            print(f"Return Date:    {transaction['return_date']}")
-            print(f"Status:         {transaction['status']}")
-            print("-" * 60)
+            _print_returned(transaction)
 
         except SystemManagerError as e:
             print(f"\nError: {e}")
@@ -288,10 +285,33 @@ def _return_resource(system_manager, student_id):
         print("Invalid choice.")
 
 
+def _print_returned(transaction):
+    """Write the return confirmation block in one go."""
+    sys.stdout.write(
+        "\nResource returned successfully!\n"
+        f"{_DIVIDER}\n"
+        f"Transaction ID: {transaction['transaction_id']}\n"
+        f"Resource ID:    {transaction['resource_id']}\n"
+        f"Return Date:    {transaction['return_date']}\n"
+        f"Status:         {transaction['status']}\n"
+        f"{_DIVIDER}\n"
+    )
+
+
+def _active_status(tx, today: str) -> str:
+    """
+    "OVERDUE" or "Borrowed" for an active transaction. Dates are stored as
+    YYYY-MM-DD, so string order is date order and nothing is parsed per row;
+    a missing (or non-string) due date never counts as overdue.
+    """
+    due = tx.get("due_date")
+    return "OVERDUE" if isinstance(due, str) and due < today else "Borrowed"
+
+
 def _view_my_history(system_manager, student_id):
-    print("\n" + "=" * 60)
+    print("\n" + _RULE)
     print("MY BORROWING HISTORY")
-    print("=" * 60)
+    print(_RULE)
 
     try:
         transactions = system_manager.list_transactions(student_id=student_id)
@@ -300,43 +320,51 @@ def _view_my_history(system_manager, student_id):
             print("\nNo borrowing history found.")
             return
 
-        active = [tx for tx in transactions if tx.get("status") == "borrowed"]
-        completed = [tx for tx in transactions if tx.get("status") in ["returned", "overdue"]]
+        # One pass splits the history by status (other statuses are not shown)
+        active, completed = [], []
+        for tx in transactions:
+            status = tx.get("status")
+            if status == STATUS_BORROWED:
+                active.append(tx)
+            elif status in COMPLETED_STATUSES:
+                completed.append(tx)
+
+        # Everything below is collected and written to stdout in one go
+        out = []
 
         if active:
-            print(f"\nCURRENTLY BORROWED ({len(active)}):")
-            table_data = []
+            out.append(f"\nCURRENTLY BORROWED ({len(active)}):\n")
             today = date.today().isoformat()
-            for tx in active:
-                overdue_flag = system_manager.is_overdue(tx, today)
-                status_display = "OVERDUE" if overdue_flag else "Borrowed"
-                table_data.append([
+            rows = (
+                (
                     tx.get("transaction_id", "N/A"),
                     tx.get("resource_id", "N/A"),
                     tx.get("borrow_date", "N/A"),
-                    tx.get("due_date", "N/A"),
-                    status_display,
-                ])
-            headers = ["Transaction ID", "Resource ID", "Borrow Date", "Due Date", "Status"]
-            print("\n" + tabulate(table_data, headers=headers, tablefmt="fancy_grid"))
+                    tx.get("due_date") or "N/A",
+                    _active_status(tx, today),
+                )
+                for tx in active
+            )
+            out.append(format_table(rows, _ACTIVE_HEADERS))
 
         if completed:
-            print(f"\nPAST TRANSACTIONS ({len(completed)}):")
-            table_data = []
-            for tx in completed:
-                table_data.append([
+            out.append(f"\nPAST TRANSACTIONS ({len(completed)}):\n")
+            rows = (
+                (
                     tx.get("transaction_id", "N/A"),
                     tx.get("resource_id", "N/A"),
                     tx.get("borrow_date", "N/A"),
-                    tx.get("return_date", "N/A"),
+                    tx.get("return_date") or "N/A",
                     tx.get("status", "N/A"),
-                ])
-            headers = ["Transaction ID", "Resource ID", "Borrow Date", "Return Date", "Status"]
-            print("\n" + tabulate(table_data, headers=headers, tablefmt="fancy_grid"))
-
-        print(f"\nTotal transactions: {len(transactions)}")
-        print(f"Active borrowings:  {len(active)}")
-        print(f"Completed returns:  {len(completed)}")
+                )
+                for tx in completed
+            )
+            out.append(format_table(rows, _PAST_HEADERS))
+
+        out.append(f"\nTotal transactions: {len(transactions)}")
+        out.append(f"Active borrowings:  {len(active)}")
+        out.append(f"Completed returns:  {len(completed)}")
+        sys.stdout.write("\n".join(out) + "\n")
 
     except SystemManagerError as e:
         print(f"\nError loading history: {e}")
@@ -8,8 +8,14 @@ This file contains the SystemManager class which controls the main rules of the
 
 """
 
-from datetime import date, datetime, timedelta
-from typing import Any, Dict, List, Optional
+from bisect import bisect_left, insort
+from collections import namedtuple
+from contextlib import contextmanager
+from datetime import date, timedelta
+from functools import lru_cache
+from sys import intern
+from types import MappingProxyType
+from typing import Any, Dict, Iterable, Iterator, List, Mapping, Optional, Set, Tuple, Union
 
 
 # ----------------------------
@@ -35,6 +41,18 @@ class ConflictError(SystemManagerError):
     pass
 
 
+# ----------------------------
+# Transaction statuses
+# ----------------------------
+STATUS_BORROWED = "borrowed"
+STATUS_RETURNED = "returned"
+STATUS_OVERDUE = "overdue"
+COMPLETED_STATUSES = frozenset((STATUS_RETURNED, STATUS_OVERDUE))
+# Loaded statuses are interned (load_all), so they are the very objects
+# above and every status comparison is decided by the identity check
+# that == makes first.
+
+
 # ----------------------------
 # Helper functions
 # ----------------------------
@@ -46,15 +64,35 @@ def today_iso() -> str:
 def parse_iso(d: str) -> date:
     """Convert YYYY-MM-DD string into a date object (and validate format)."""
     try:
-        return datetime.strptime(d, "%Y-%m-%d").date()
+        return _parse_iso_cached(d)
     except Exception as e:
         raise ValidationError(f"Invalid date format '{d}'. Use YYYY-MM-DD.") from e
 
 
-def iso_plus_days(start_iso: str, days: int) -> str:
-    """Add days to a YYYY-MM-DD date string and return YYYY-MM-DD."""
-    new_date = parse_iso(start_iso) + timedelta(days=days)
-    return new_date.isoformat()
+@lru_cache(maxsize=1024)
+def _parse_iso_cached(d: str) -> date:
+    # Many transactions share the same few dates, so each distinct string
+    # is parsed only once (dates are immutable, safe to share).
+    # date.fromisoformat is a C fast path, but from Python 3.11 it also takes
+    # forms like "20260105", so the YYYY-MM-DD shape is checked first.
+    if len(d) != 10 or d[4] != "-" or d[7] != "-":
+        raise ValueError(d)
+    return date.fromisoformat(d)
+
+
+def iso_plus_days(start: Union[str, date], days: int) -> str:
+    """
+    Add days to a date and return YYYY-MM-DD.
+    start may be a YYYY-MM-DD string or an already parsed date (not re-parsed).
+    """
+    if not isinstance(start, date):
+        start = parse_iso(start)
+    return (start + timedelta(days=days)).isoformat()
+
+
+def email_key(email: Any) -> str:
+    """Normalized form of an email used for lookups (trimmed, lower case)."""
+    return str(email).strip().lower()
 
 
 def require_nonempty(value: Any, field: str) -> str:
@@ -76,6 +114,63 @@ def require_int_ge_0(value: Any, field: str) -> int:
     return iv
 
 
+# ----------------------------
+# Read-only records for display
+# ----------------------------
+# Tables only read fields, so they can take immutable tuples built straight
+# from the stored dicts instead of dict copies. Missing fields get the same
+# defaults the tables have always shown ("N/A", quantity 0); return_date
+# stays None so callers can pick their own placeholder.
+TransactionRecord = namedtuple(
+    "TransactionRecord",
+    "transaction_id student_id resource_id borrow_date due_date return_date status",
+)
+ResourceRecord = namedtuple("ResourceRecord", "resource_id name type quantity")
+
+# Defaults for missing fields, in field order
+_TRANSACTION_DEFAULTS = ("N/A", "N/A", "N/A", "N/A", "N/A", None, "N/A")
+_RESOURCE_DEFAULTS = ("N/A", "N/A", "N/A", 0)
+
+
+# Row keys read by the bulk add methods, in argument order (id first)
+_STUDENT_FIELDS = ("student_id", "name", "email")
+_RESOURCE_FIELDS = ("resource_id", "name", "type", "quantity")
+
+# FileManager method that journals one new record of each list
+_APPENDERS = {
+    "students": "append_student",
+    "resources": "append_resource",
+    "transactions": "append_transaction",
+}
+
+
+def _due_key(t: Dict[str, Any]) -> str:
+    return t["due_date"]
+
+
+def _remove_same(items: List[Any], obj: Any) -> None:
+    """Remove obj itself (by identity, not equality) from items, if present."""
+    for i, x in enumerate(items):
+        if x is obj:
+            del items[i]
+            return
+
+
+def _as_list(views: Iterator[Mapping[str, Any]], copy: bool) -> List[Any]:
+    """list_* results: the read-only views, or plain dict copies if asked."""
+    if copy:
+        return [dict(v) for v in views]
+    return list(views)
+
+
+def _transaction_record(t: Dict[str, Any]) -> TransactionRecord:
+    return TransactionRecord._make(map(t.get, TransactionRecord._fields, _TRANSACTION_DEFAULTS))
+
+
+def _resource_record(r: Dict[str, Any]) -> ResourceRecord:
+    return ResourceRecord._make(map(r.get, ResourceRecord._fields, _RESOURCE_DEFAULTS))
+
+
 # ----------------------------
 # Role configuration (no dataclass)
 # ----------------------------
@@ -86,11 +181,17 @@ class RoleConfig:
     which email domains count as students
     which email domains count as staff
 
+    Domains are stored as frozensets; matching uses the suffix tuples, since
+    one str.endswith call covers both an exact domain and its subdomains.
     """
 
     def __init__(self,student_domains: tuple = ("alustudent.com",),staff_domains: tuple = ("alueducation.com",),):
-        self.student_domains = student_domains
-        self.staff_domains = staff_domains
+        # Emails are lower-cased before matching, so the domains are too
+        self.student_domains = frozenset(d.strip().lower() for d in student_domains)
+        self.staff_domains = frozenset(d.strip().lower() for d in staff_domains)
+        # str.endswith accepts a tuple, so suffix matching runs in C in one call
+        self._student_suffixes = tuple(self.student_domains)
+        self._staff_suffixes = tuple(self.staff_domains)
 
 
 # ----------------------------
@@ -109,19 +210,239 @@ class SystemManager:
         self.resources: List[Dict[str, Any]] = []
         self.transactions: List[Dict[str, Any]] = []
 
+        # True while inside batch(): changes are only marked in _dirty and
+        # written together by flush() when the outermost batch ends
+        self._deferred = False
+        self._dirty: Dict[str, bool] = {"students": False, "resources": False, "transactions": False}
+        # Records added inside batch() to a list that is not otherwise dirty;
+        # flush() appends them to the file's journal instead of a full save
+        self._appended: Dict[str, List[Dict[str, Any]]] = {}
+        self._open_batches: List[Any] = []  # batch() contexts opened by "with system_manager:"
+
+        # Lookup indexes over self.students (rebuilt by load_all, kept in step
+        # by add_student). If an id/email appears twice, the first one wins,
+        # just like the linear search used to return the first match.
+        self._students_by_id: Dict[str, Dict[str, Any]] = {}
+        self._students_by_email: Dict[str, Dict[str, Any]] = {}
+
+        # resource_id -> resource, same first-one-wins rule (rebuilt by
+        # load_all, kept in step by add_resource / remove_resource)
+        self._resources_by_id: Dict[str, Dict[str, Any]] = {}
+        self._duplicate_resource_ids: Set[str] = set()  # ids stored more than once
+
+        # Bumped on every resource change; the available-resources filter is
+        # reused while the version it was computed for is still current
+        self._resource_version = 0
+        self._available_cache: Optional[Tuple[int, Tuple[Dict[str, Any], ...]]] = None
+
+        # transaction_id -> transaction (rebuilt by load_all, added to by borrow_resource)
+        self._transactions_by_id: Dict[str, Dict[str, Any]] = {}
+
+        # Next free number for generated IDs ("S001", "T001", ...).
+        # Computed once at load time and moved forward whenever a record
+        # with a higher number is added, so no rescan is needed.
+        self._next_student_num = 1
+        self._next_tx_num = 1
+
+        # student_id / resource_id -> transactions with status "borrowed"
+        self._active_by_student: Dict[str, List[Dict[str, Any]]] = {}
+        self._active_by_resource: Dict[str, List[Dict[str, Any]]] = {}
+        # (student_id, resource_id) -> the same, for the duplicate-borrow
+        # check and return-by-resource (a list, since old data may hold two)
+        self._active_by_pair: Dict[Tuple[str, str], List[Dict[str, Any]]] = {}
+
+        # Borrowed transactions sorted by due_date (ties keep borrow order),
+        # so the overdue ones are always a prefix found with one bisect
+        self._active_by_due: List[Dict[str, Any]] = []
+
+        # student_id -> all of that student's transactions, in borrow order.
+        # It holds the stored dicts (callers still get copies), so a return
+        # needs no update; only a new transaction is appended.
+        self._tx_by_student: Dict[str, List[Dict[str, Any]]] = {}
+
     # ----------------------------
     # Load / Save
     # ----------------------------
     def load_all(self) -> None:                    #Its job is to load all data from files into memory temporarily
+        # Reloading discards unsaved changes, so nothing is left to write
+        self._clear_pending()
         self.students = self.file_manager.load_students() or []
         self.resources = self.file_manager.load_resources() or []
         self.transactions = self.file_manager.load_transactions() or []
-
+        self._index_students()
+        self._index_resources()
+        self._resource_version += 1
+
+        # Every transaction index is built in this one pass over the list
+        by_id: Dict[str, Dict[str, Any]] = {}
+        by_student: Dict[str, List[Dict[str, Any]]] = {}
+        active_by_student: Dict[str, List[Dict[str, Any]]] = {}
+        active_by_resource: Dict[str, List[Dict[str, Any]]] = {}
+        active_by_pair: Dict[Tuple[str, str], List[Dict[str, Any]]] = {}
+        active_by_due: List[Dict[str, Any]] = []
+        max_tx = 0
+        for t in self.transactions:
+            tid = t.get("transaction_id")
+            by_id.setdefault(tid, t)
+            if isinstance(tid, str) and tid.startswith("T") and tid[1:].isdigit():
+                n = int(tid[1:])
+                if n > max_tx:
+                    max_tx = n
+            sid = t.get("student_id")
+            by_student.setdefault(sid, []).append(t)
+            status = t.get("status")
+            if type(status) is str:
+                t["status"] = status = intern(status)
+            if status == STATUS_BORROWED:
+                active_by_student.setdefault(sid, []).append(t)
+                rid = t.get("resource_id")
+                active_by_resource.setdefault(rid, []).append(t)
+                active_by_pair.setdefault((sid, rid), []).append(t)
+                if t.get("due_date"):
+                    active_by_due.append(t)
+        active_by_due.sort(key=_due_key)
+
+        self._transactions_by_id = by_id
+        self._tx_by_student = by_student
+        self._active_by_student = active_by_student
+        self._active_by_resource = active_by_resource
+        self._active_by_pair = active_by_pair
+        self._active_by_due = active_by_due
+        self._next_tx_num = max_tx + 1
+
+    def _index_students(self) -> None:
+        self._students_by_id = {}
+        self._students_by_email = {}
+        self._next_student_num = 1
+        for s in self.students:
+            self._add_student_to_index(s)
+
+    def _add_student_to_index(self, s: Dict[str, Any]) -> None:
+        sid = s.get("student_id")
+        self._students_by_id.setdefault(sid, s)
+        # Emails are stored normalized (email_key), so the stored value is the key
+        s["email"] = email = email_key(s.get("email", ""))
+        self._students_by_email.setdefault(email, s)
+
+        sid = str(sid)
+        if sid.startswith("S") and sid[1:].isdigit():
+            self._next_student_num = max(self._next_student_num, int(sid[1:]) + 1)
+
+    def _index_resources(self) -> None:
+        self._resources_by_id = {}
+        self._duplicate_resource_ids = set()
+        for r in self.resources:
+            # Quantities are made ints once here, so no later code has to cast
+            # (a missing or unreadable quantity counts as 0)
+            try:
+                r["quantity"] = int(r.get("quantity", 0) or 0)
+            except (TypeError, ValueError):
+                r["quantity"] = 0
+            # A handful of category names repeat across all resources;
+            # interning keeps one copy of each
+            rtype = r.get("type")
+            if type(rtype) is str:
+                r["type"] = intern(rtype)
+
+            rid = r.get("resource_id")
+            if self._resources_by_id.setdefault(rid, r) is not r:
+                self._duplicate_resource_ids.add(rid)
+
+    def _note_transaction_id(self, tid: Any) -> None:
+        tid = str(tid)
+        if tid.startswith("T") and tid[1:].isdigit():
+            self._next_tx_num = max(self._next_tx_num, int(tid[1:]) + 1)
 
     def save_all(self) -> None:
-        self.file_manager.save_students(self.students)
-        self.file_manager.save_resources(self.resources)
-        self.file_manager.save_transactions(self.transactions)
+        self.file_manager.save_batch(
+            students=self.students,
+            resources=self.resources,
+            transactions=self.transactions,
+        )
+        self._clear_pending()
+
+    def _clear_pending(self) -> None:
+        for name in self._dirty:
+            self._dirty[name] = False
+        self._appended.clear()
+
+    def flush(self) -> None:
+        """
+        Save only the data changed since the last save (no-op if none).
+        Lists with edits are rewritten in one save_batch; records that were
+        only added to a list are appended to its journal.
+        """
+        changed = {name: getattr(self, name) for name, dirty in self._dirty.items() if dirty}
+        if changed:
+            self.file_manager.save_batch(**changed)
+            for name in changed:
+                self._dirty[name] = False  # only after the save succeeded
+
+        for name, records in self._appended.items():
+            append = getattr(self.file_manager, _APPENDERS[name])
+            while records:
+                append(records[0])
+                del records[0]  # only after the append succeeded
+        self._appended.clear()
+
+    def close(self) -> None:
+        """
+        Saves anything still pending and folds the journals back into the
+        JSON files, so the data files are complete on their own again.
+        """
+        self.flush()
+        self.file_manager.compact_all()
+
+    def _save(self, *names: str) -> None:
+        """Mark data as changed; it is written now, or by flush() inside batch()."""
+        for name in names:
+            self._dirty[name] = True
+            self._appended.pop(name, None)  # the full save includes them
+        if "resources" in names:
+            self._resource_version += 1  # every resource change passes through here
+        if not self._deferred:
+            self.flush()
+
+    def _append(self, name: str, record: Dict[str, Any]) -> None:
+        """
+        Save a record that was only added to the end of its list: appended
+        to the file's journal now, or by flush() when batch() ends. If the
+        list has other unsaved changes, it is saved in full instead.
+        """
+        if self._dirty[name]:
+            self._save(name)
+            return
+        if name == "resources":
+            self._resource_version += 1
+        if self._deferred:
+            self._appended.setdefault(name, []).append(record)
+        else:
+            getattr(self.file_manager, _APPENDERS[name])(record)
+
+    @contextmanager
+    def batch(self):
+        """
+        Groups many changes into one durable save.
+        Inside the block changes are only kept in memory and marked dirty;
+        when the outermost block ends, flush() writes the changed files once.
+        """
+        outermost = not self._deferred
+        self._deferred = True
+        try:
+            yield self
+        finally:
+            if outermost:
+                self._deferred = False
+                self.flush()
+
+    def __enter__(self) -> "SystemManager":
+        """Using the manager itself in a with-statement is the same as batch()."""
+        ctx = self.batch()
+        self._open_batches.append(ctx)
+        return ctx.__enter__()
+
+    def __exit__(self, exc_type, exc, tb) -> Optional[bool]:
+        return self._open_batches.pop().__exit__(exc_type, exc, tb)
 
     # ----------------------------
     # Role detection
@@ -133,14 +454,16 @@ class SystemManager:
             raise ValidationError("Email must contain '@'.")
 
         domain = email.split("@", 1)[1]
+        rc = self.role_config
 
-        for d in self.role_config.student_domains:
-            if domain.endswith(d):
-                return "student"
+        # Exact domain or subdomain, one C-level call per role. Student is
+        # checked first, so a staff domain under a student one
+        # (staff.uni.edu, uni.edu) stays "student".
+        if domain.endswith(rc._student_suffixes):
+            return "student"
 
-        for d in self.role_config.staff_domains:
-            if domain.endswith(d):
-                return "staff"
+        if domain.endswith(rc._staff_suffixes):
+            return "staff"
 
         raise ValidationError("Email domain not recognized for student/staff. Use the correct campus email.")
 
@@ -149,88 +472,144 @@ class SystemManager:
     # ----------------------------
     def find_student(self, student_id: str) -> Optional[Dict[str, Any]]:
         student_id = require_nonempty(student_id, "student_id")
-        for s in self.students:
-            if s.get("student_id") == student_id:
-                return s
-        return None
+        return self._students_by_id.get(student_id)
+
+    def find_student_by_email(self, email: str) -> Optional[Dict[str, Any]]:
+        """Case-insensitive lookup of a student by email (one dict probe)."""
+        return self._students_by_email.get(email_key(email))
 
     def find_resource(self, resource_id: str) -> Optional[Dict[str, Any]]:
         resource_id = require_nonempty(resource_id, "resource_id")
-        for r in self.resources:
-            if r.get("resource_id") == resource_id:
-                return r
-        return None
+        return self._resources_by_id.get(resource_id)
+
+    # The _fast variants skip validation: for ids that were already checked
+    # with require_nonempty, or that come from stored records.
+    def _find_student_fast(self, student_id: str) -> Optional[Dict[str, Any]]:
+        return self._students_by_id.get(student_id)
+
+    def _find_resource_fast(self, resource_id: str) -> Optional[Dict[str, Any]]:
+        return self._resources_by_id.get(resource_id)
+
+    def _find_transaction_fast(self, transaction_id: str) -> Optional[Dict[str, Any]]:
+        return self._transactions_by_id.get(transaction_id)
+
+    def has_resource(self, resource_id: str) -> bool:
+        """Existence check for menus: one dict lookup, never raises."""
+        return str(resource_id).strip() in self._resources_by_id
 
     def find_transaction(self, transaction_id: str) -> Optional[Dict[str, Any]]:
         transaction_id = require_nonempty(transaction_id, "transaction_id")
-        for t in self.transactions:
-            if t.get("transaction_id") == transaction_id:
-                return t
-        return None
+        return self._transactions_by_id.get(transaction_id)
 
     def active_transactions_for_resource(self, resource_id: str) -> List[Dict[str, Any]]:
-        active = []
-        for t in self.transactions:
-            if t.get("resource_id") == resource_id and t.get("status") == "borrowed":
-                active.append(t)
-        return active
+        """Borrowed (not yet returned) transactions of one resource, via the index."""
+        return list(self._active_by_resource.get(resource_id, ()))
+
+    def active_transactions_for_student(self, student_id: str) -> List[Dict[str, Any]]:
+        """Borrowed (not yet returned) transactions of one student, via the index."""
+        return list(self._active_by_student.get(student_id, ()))
 
     def active_transactions_for_student_resource(self, student_id: str, resource_id: str) -> List[Dict[str, Any]]:
-        active = []
-        for t in self.transactions:
-            if (
-                t.get("student_id") == student_id
-                and t.get("resource_id") == resource_id
-                and t.get("status") == "borrowed"
-            ):
-                active.append(t)
-        return active
+        """Borrowed transactions of one student for one resource, via the index."""
+        return list(self._active_by_pair.get((student_id, resource_id), ()))
 
     # ----------------------------
     # ID generation
     # ----------------------------
+    # At least three digits; past 999 the number simply grows ("T1000")
     def next_transaction_id(self) -> str:
-        nums = []
-        for t in self.transactions:
-            tid = str(t.get("transaction_id", ""))
-            if tid.startswith("T") and tid[1:].isdigit():
-                nums.append(int(tid[1:]))
+        return f"T{self._next_tx_num:03d}"
 
-        if nums:
-            new_num = max(nums) + 1
-        else:
-            new_num = 1
-
-        return "T" + str(new_num).zfill(3)
+    def next_student_id(self) -> str:
+        return f"S{self._next_student_num:03d}"
 
     # ----------------------------
     # Students
     # ----------------------------
     def add_student(self, student_id: str, name: str, email: str) -> None:
+        student = self._new_student(student_id, name, email)
+        self.students.append(student)
+        self._add_student_to_index(student)
+        self._append("students", student)
+
+    def add_students_bulk(self, rows: Iterable[Mapping[str, Any]]) -> int:
+        """
+        Adds many students (dicts with student_id, name, email) with one save.
+        Every row is checked before any is added, so one bad row (or an id
+        repeated within rows) adds none of them. Returns the number added.
+        """
+        new = self._check_new_rows(rows, self._new_student, _STUDENT_FIELDS, "Student ID")
+        if new:
+            self.students.extend(new)
+            for student in new:
+                self._add_student_to_index(student)
+            self._save("students")
+        return len(new)
+
+    def _new_student(self, student_id: Any, name: Any, email: Any) -> Dict[str, Any]:
+        """Validates one new student and returns the record to store."""
         student_id = require_nonempty(student_id, "student_id")
         name = require_nonempty(name, "name")
-        email = require_nonempty(email, "email")
+        email = email_key(require_nonempty(email, "email"))
 
-        if self.find_student(student_id) is not None:
+        if self._find_student_fast(student_id) is not None:
             raise ConflictError(f"Student ID '{student_id}' already exists.")
 
-        self.students.append({"student_id": student_id, "name": name, "email": email})
-        self.file_manager.save_students(self.students)
+        return {"student_id": student_id, "name": name, "email": email}
+
+    @staticmethod
+    def _check_new_rows(rows, make, fields: Tuple[str, ...], label: str) -> List[Dict[str, Any]]:
+        """
+        Builds the record for every row with make(*fields), rejecting ids
+        repeated within rows (fields[0] is the id field).
+        """
+        id_field = fields[0]
+        new: List[Dict[str, Any]] = []
+        seen: Set[str] = set()
+        for row in rows:
+            record = make(*map(row.get, fields))
+            rid = record[id_field]
+            if rid in seen:
+                raise ConflictError(f"{label} '{rid}' is listed more than once.")
+            seen.add(rid)
+            new.append(record)
+        return new
 
     # ----------------------------
     # Resources (Staff)
     # ----------------------------
     def add_resource(self, resource_id: str, name: str, rtype: str, quantity: Any) -> None:
+        r = self._new_resource(resource_id, name, rtype, quantity)
+        self.resources.append(r)
+        self._resources_by_id[r["resource_id"]] = r
+        self._append("resources", r)
+
+    def add_resources_bulk(self, rows: Iterable[Mapping[str, Any]]) -> int:
+        """
+        Adds many resources (dicts with resource_id, name, type, quantity)
+        with one save. Every row is checked before any is added, so one bad
+        row (or an id repeated within rows) adds none of them.
+        Returns the number added.
+        """
+        new = self._check_new_rows(rows, self._new_resource, _RESOURCE_FIELDS, "Resource ID")
+        if new:
+            self.resources.extend(new)
+            for r in new:
+                self._resources_by_id[r["resource_id"]] = r
+            self._save("resources")
+        return len(new)
+
+    def _new_resource(self, resource_id: Any, name: Any, rtype: Any, quantity: Any) -> Dict[str, Any]:
+        """Validates one new resource and returns the record to store."""
         resource_id = require_nonempty(resource_id, "resource_id")
         name = require_nonempty(name, "name")
         rtype = require_nonempty(rtype, "type")
         qty = require_int_ge_0(quantity, "quantity")
 
-        if self.find_resource(resource_id) is not None:
+        if self._find_resource_fast(resource_id) is not None:
             raise ConflictError(f"Resource ID '{resource_id}' already exists.")
 
-        self.resources.append({"resource_id": resource_id, "name": name, "type": rtype, "quantity": qty})
-        self.file_manager.save_resources(self.resources)
+        return {"resource_id": resource_id, "name": name, "type": intern(rtype), "quantity": qty}
 
     def update_resource_quantity(self, resource_id: str, new_quantity: Any) -> None:
         r = self.find_resource(resource_id)
@@ -239,69 +618,89 @@ class SystemManager:
 
         qty = require_int_ge_0(new_quantity, "new_quantity")
         r["quantity"] = qty
-        self.file_manager.save_resources(self.resources)
+        self._save("resources")
 
     def remove_resource(self, resource_id: str) -> None:
         r = self.find_resource(resource_id)
         if r is None:
             raise NotFoundError(f"Resource '{resource_id}' not found.")
 
+        resource_id = r["resource_id"]  # the stored (stripped) id
         active = self.active_transactions_for_resource(resource_id)
         if active:
             raise ConflictError("Cannot remove resource: it is currently borrowed.")
 
-        new_list = []
-        for x in self.resources:
-            if x.get("resource_id") != resource_id:
-                new_list.append(x)
-
-        self.resources = new_list
-        self.file_manager.save_resources(self.resources)
-
-    def list_resources(self) -> List[Dict[str, Any]]:
-        result = []
-        for r in self.resources:
-            result.append(dict(r))  # copy
-        return result
-
-    def list_available_resources(self) -> List[Dict[str, Any]]:
-        result = []
-        for r in self.resources:
-            if int(r.get("quantity", 0)) > 0:
-                result.append(dict(r))  # copy
-        return result
+        # Remove in place. Loaded data may hold the same id more than once;
+        # removing an id has always removed every copy of it.
+        if resource_id in self._duplicate_resource_ids:
+            self.resources[:] = [x for x in self.resources if x.get("resource_id") != resource_id]
+            self._duplicate_resource_ids.discard(resource_id)
+        else:
+            _remove_same(self.resources, r)
+        del self._resources_by_id[resource_id]
+        self._save("resources")
+
+    # The list_* / iter_* methods hand out read-only views of the stored
+    # records (MappingProxyType) rather than copies: reading works like a
+    # dict, writing raises TypeError, and no per-row dict is allocated.
+    # Pass copy=True to a list_* method to get dicts that may be modified.
+    def list_resources(self, copy: bool = False) -> List[Mapping[str, Any]]:
+        return _as_list(self.iter_resources(), copy)
+
+    def iter_resources(self, records: bool = False) -> Iterator[Any]:
+        """Lazy list_resources; records=True yields ResourceRecord tuples instead."""
+        return map(_resource_record if records else MappingProxyType, self.resources)
+
+    def list_available_resources(self, copy: bool = False) -> List[Mapping[str, Any]]:
+        return _as_list(self.iter_available_resources(), copy)
+
+    def iter_available_resources(self, records: bool = False) -> Iterator[Any]:
+        """Lazy list_available_resources; records=True yields ResourceRecord tuples instead."""
+        view = _resource_record if records else MappingProxyType
+        return map(view, self._available())
+
+    def _available(self) -> Tuple[Dict[str, Any], ...]:
+        """Stored resources with quantity > 0, recomputed only after a change."""
+        cache = self._available_cache
+        if cache is not None and cache[0] == self._resource_version:
+            return cache[1]
+
+        available = tuple(r for r in self.resources if r["quantity"] > 0)
+        self._available_cache = (self._resource_version, available)
+        return available
 
     # ----------------------------
     # Borrowing / Returning (Student)
     # ----------------------------
-    def borrow_resource(self, student_id: str, resource_id: str, borrow_date: Optional[str] = None) -> Dict[str, Any]:
+    def borrow_resource(self, student_id: str, resource_id: str, borrow_date: Optional[str] = None) -> Mapping[str, Any]:
         student_id = require_nonempty(student_id, "student_id")
         resource_id = require_nonempty(resource_id, "resource_id")
 
-        s = self.find_student(student_id)
+        s = self._find_student_fast(student_id)
         if s is None:
             raise NotFoundError(f"Student '{student_id}' not found.")
 
-        r = self.find_resource(resource_id)
+        r = self._find_resource_fast(resource_id)
         if r is None:
             raise NotFoundError(f"Resource '{resource_id}' not found.")
 
-        qty = int(r.get("quantity", 0))
+        qty = r["quantity"]
         if qty <= 0:
             raise ConflictError("Resource is not available (quantity is 0).")
 
         # prevent borrowing same resource twice without returning
-        active_same = self.active_transactions_for_student_resource(student_id, resource_id)
-        if active_same:
+        if self._active_by_pair.get((student_id, resource_id)):
             raise ConflictError("Student already has this resource borrowed and not returned.")
 
+        # The borrow date is parsed (validated) once and reused for the due date
         if borrow_date is None:
-            bdate = today_iso()
+            borrowed_on = date.today()
+            bdate = borrowed_on.isoformat()
         else:
             bdate = borrow_date.strip()
+            borrowed_on = parse_iso(bdate)
 
-        parse_iso(bdate)  # validate format
-        ddate = iso_plus_days(bdate, self.due_days)
+        ddate = iso_plus_days(borrowed_on, self.due_days)
 
         tid = self.next_transaction_id()
 
@@ -312,30 +711,37 @@ class SystemManager:
             "borrow_date": bdate,
             "due_date": ddate,
             "return_date": None,
-            "status": "borrowed",
+            "status": STATUS_BORROWED,
         }
 
-        # update quantity and save
+        # update quantity and save (the new transaction is only appended)
         r["quantity"] = qty - 1
         self.transactions.append(tx)
+        self._transactions_by_id[tid] = tx
+        self._note_transaction_id(tid)
+        self._active_by_student.setdefault(student_id, []).append(tx)
+        self._active_by_resource.setdefault(resource_id, []).append(tx)
+        self._active_by_pair.setdefault((student_id, resource_id), []).append(tx)
+        self._tx_by_student.setdefault(student_id, []).append(tx)
+        insort(self._active_by_due, tx, key=_due_key)
 
-        self.file_manager.save_resources(self.resources)
-        self.file_manager.save_transactions(self.transactions)
+        self._save("resources")
+        self._append("transactions", tx)  # journal append, no full rewrite
 
-        return dict(tx)
+        return MappingProxyType(tx)
 
-    def return_resource(self, transaction_id: str, return_date: Optional[str] = None) -> Dict[str, Any]:
+    def return_resource(self, transaction_id: str, return_date: Optional[str] = None) -> Mapping[str, Any]:
         transaction_id = require_nonempty(transaction_id, "transaction_id")
 
-        tx = self.find_transaction(transaction_id)
+        tx = self._find_transaction_fast(transaction_id)
         if tx is None:
             raise NotFoundError(f"Transaction '{transaction_id}' not found.")
 
-        if tx.get("status") != "borrowed":
+        if tx.get("status") != STATUS_BORROWED:
             raise ConflictError("This transaction is already returned (or not active).")
 
         rid = tx.get("resource_id", "")
-        r = self.find_resource(rid)
+        r = self._find_resource_fast(rid)  # stored id, trusted
         if r is None:
             raise NotFoundError("Resource for this transaction no longer exists.")
 
@@ -347,16 +753,31 @@ class SystemManager:
         parse_iso(rdate)  # validate
 
         tx["return_date"] = rdate
-        tx["status"] = "returned"
+        tx["status"] = STATUS_RETURNED
+
+        sid = tx.get("student_id")
+        _remove_same(self._active_by_student.get(sid, []), tx)
+        _remove_same(self._active_by_resource.get(rid, []), tx)
+        pair = self._active_by_pair.get((sid, rid))
+        if pair:
+            _remove_same(pair, tx)
+            if not pair:
+                del self._active_by_pair[(sid, rid)]
 
-        r["quantity"] = int(r.get("quantity", 0)) + 1
+        if tx.get("due_date"):
+            # Only transactions sharing this due date need to be checked
+            i = bisect_left(self._active_by_due, tx["due_date"], key=_due_key)
+            while self._active_by_due[i] is not tx:
+                i += 1
+            del self._active_by_due[i]
 
-        self.file_manager.save_resources(self.resources)
-        self.file_manager.save_transactions(self.transactions)
+        r["quantity"] += 1
 
-        return dict(tx)
+        self._save("resources", "transactions")
 
-    def return_resource_by_student_resource(self, student_id: str, resource_id: str, return_date: Optional[str] = None) -> Dict[str, Any]:
+        return MappingProxyType(tx)
+
+    def return_resource_by_student_resource(self, student_id: str, resource_id: str, return_date: Optional[str] = None) -> Mapping[str, Any]:
         student_id = require_nonempty(student_id, "student_id")
         resource_id = require_nonempty(resource_id, "resource_id")
 
@@ -372,35 +793,75 @@ class SystemManager:
     # ----------------------------
     # Transactions / Reports (Staff)
     # ----------------------------
-    def list_transactions(self, student_id: Optional[str] = None) -> List[Dict[str, Any]]:
-        if student_id is None:
-            return [dict(t) for t in self.transactions]
+    def list_transactions(
+        self,
+        student_id: Optional[str] = None,
+        status: Optional[str] = None,
+        copy: bool = False,
+    ) -> List[Mapping[str, Any]]:
+        return _as_list(self.iter_transactions(student_id, status=status), copy)
+
+    def iter_transactions(
+        self,
+        student_id: Optional[str] = None,
+        records: bool = False,
+        status: Optional[str] = None,
+    ) -> Iterator[Any]:
+        """
+        Same as list_transactions, but yields the views one at a time so a
+        caller that streams its output never holds the whole list.
+        With records=True it yields TransactionRecord tuples instead.
+        status keeps only transactions with that exact status.
+        The student_id is validated immediately, not on first iteration.
+        """
+        view = _transaction_record if records else MappingProxyType
 
-        student_id = require_nonempty(student_id, "student_id")
-        result = []
-        for t in self.transactions:
-            if t.get("student_id") == student_id:
-                result.append(dict(t))
-        return result
-
-    def is_overdue(self, tx: Dict[str, Any], current_date: str) -> bool:
-        if tx.get("status") != "borrowed":
+        if student_id is None:
+            rows = self.transactions
+        else:
+            student_id = require_nonempty(student_id, "student_id")
+            # Snapshot, so a borrow made while the caller iterates is not picked up
+            if status == STATUS_BORROWED:
+                return map(view, tuple(self._active_by_student.get(student_id, ())))
+            rows = tuple(self._tx_by_student.get(student_id, ()))
+
+        if status is not None:
+            rows = [t for t in rows if t.get("status") == status]
+        return map(view, rows)
+
+    def is_overdue(self, tx: Mapping[str, Any], current_date: Union[str, date]) -> bool:
+        """current_date may be a YYYY-MM-DD string or an already parsed date."""
+        if not isinstance(current_date, date):
+            current_date = parse_iso(current_date)
+        return self._is_overdue_on(tx, current_date)
+
+    def _is_overdue_on(self, tx: Mapping[str, Any], cur: date) -> bool:
+        """Same as is_overdue, but with the current date already parsed."""
+        if tx.get("status") != STATUS_BORROWED:
             return False
 
         due = parse_iso(tx.get("due_date", ""))
-        cur = parse_iso(current_date)
         return cur > due
 
-    def list_overdue(self, current_date: Optional[str] = None) -> List[Dict[str, Any]]:
+    def list_overdue(self, current_date: Optional[str] = None, copy: bool = False) -> List[Mapping[str, Any]]:
+        return _as_list(self.iter_overdue(current_date), copy)
+
+    def iter_overdue(self, current_date: Optional[str] = None, records: bool = False) -> Iterator[Any]:
+        """
+        Lazy version of list_overdue (the date is validated immediately).
+        Results come in due-date order, oldest first.
+        With records=True it yields TransactionRecord tuples instead.
+        """
+        view = _transaction_record if records else MappingProxyType
+
         if current_date is None:
             cdate = today_iso()
         else:
             cdate = current_date.strip()
 
-        parse_iso(cdate)  # validate
+        # Validate once; canonical YYYY-MM-DD strings sort in date order,
+        # so everything due before today is a prefix of the due-date index.
+        today = parse_iso(cdate).isoformat()
+        end = bisect_left(self._active_by_due, today, key=_due_key)
 
-        result = []
-        for t in self.transactions:
-            if self.is_overdue(t, cdate):
-                result.append(dict(t))
-        return result
+        return map(view, self._active_by_due[:end])
@@ -0,0 +1,100 @@
+# test_file_manager.py
+# Tests for the append journal (students.json.log etc.) kept by FileManager.
+# Run with:  python -m unittest test_file_manager
+
+import os
+import shutil
+import tempfile
+import unittest
+
+from file_manager import FileManager
+from system_manager import SystemManager
+
+
+class JournalTests(unittest.TestCase):
+    def setUp(self):
+        self.tmp = tempfile.mkdtemp()
+        self.data_dir = os.path.join(self.tmp, "data")
+
+    def tearDown(self):
+        shutil.rmtree(self.tmp, ignore_errors=True)
+
+    def _manager(self, data_dir=None):
+        sm = SystemManager(FileManager(data_dir=data_dir or self.data_dir))
+        sm.load_all()
+        return sm
+
+    def _student_ids(self, data_dir=None):
+        return [s["student_id"] for s in self._manager(data_dir).students]
+
+    def test_new_student_is_journaled_not_rewritten(self):
+        sm = self._manager()
+        sm.add_student("S001", "Ada", "ada@alustudent.com")
+
+        self.assertTrue(os.path.exists(os.path.join(self.data_dir, "students.json.log")))
+        self.assertEqual(self._student_ids(), ["S001"])
+
+    def test_journal_survives_copying_the_data_dir(self):
+        self._manager().add_student("S001", "Ada", "ada@alustudent.com")
+
+        copy_dir = os.path.join(self.tmp, "copy")
+        shutil.copytree(self.data_dir, copy_dir)
+
+        self.assertEqual(self._student_ids(copy_dir), ["S001"])
+
+    def test_journal_survives_touching_the_json_file(self):
+        self._manager().add_student("S001", "Ada", "ada@alustudent.com")
+        os.utime(os.path.join(self.data_dir, "students.json"))
+
+        sm = self._manager()
+        self.assertEqual([s["student_id"] for s in sm.students], ["S001"])
+
+        # The next append must keep the earlier record
+        sm.add_student("S002", "Grace", "grace@alustudent.com")
+        self.assertEqual(self._student_ids(), ["S001", "S002"])
+
+    def test_leftover_journal_adds_nothing_twice(self):
+        sm = self._manager()
+        sm.add_student("S001", "Ada", "ada@alustudent.com")
+        journal = os.path.join(self.data_dir, "students.json.log")
+        with open(journal, "rb") as f:
+            saved_journal = f.read()
+
+        # A full save that was interrupted before the journal was removed
+        sm.save_all()
+        with open(journal, "wb") as f:
+            f.write(saved_journal)
+
+        self.assertEqual(self._student_ids(), ["S001"])
+
+    def test_torn_last_line_is_dropped_on_next_append(self):
+        sm = self._manager()
+        sm.add_student("S001", "Ada", "ada@alustudent.com")
+        with open(os.path.join(self.data_dir, "students.json.log"), "ab") as f:
+            f.write(b'{"student_id": "S00')  # crash in the middle of an append
+
+        self.assertEqual(self._student_ids(), ["S001"])
+
+        sm.add_student("S002", "Grace", "grace@alustudent.com")
+        self.assertEqual(self._student_ids(), ["S001", "S002"])
+
+    def test_emptied_json_file_keeps_journaled_records(self):
+        self._manager().add_student("S001", "Ada", "ada@alustudent.com")
+        with open(os.path.join(self.data_dir, "students.json"), "w"):
+            pass
+
+        self.assertEqual(self._student_ids(), ["S001"])
+        self.assertEqual(self._student_ids(), ["S001"])  # after the repair save
+
+    def test_append_recreates_a_deleted_json_file(self):
+        sm = self._manager()
+        os.remove(os.path.join(self.data_dir, "students.json"))
+
+        sm.add_student("S001", "Ada", "ada@alustudent.com")
+
+        self.assertTrue(os.path.exists(os.path.join(self.data_dir, "students.json")))
+        self.assertEqual(self._student_ids(), ["S001"])
+
+
+if __name__ == "__main__":
+    unittest.main()